@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Mapping, List, Union, Type, TypeVar, Tuple
+from typing import Any, Optional, Mapping, List, Union, Type, TypeVar, Tuple, Dict
 
 import abc
 
@@ -40,6 +40,9 @@ T = TypeVar('T', bound='ArrayTech')
 
 
 class ArrayPlaceInfo:
+    __slots__ = ('_tech_cls', '_tr_manager', '_conn_layer', '_top_layer', '_blk_options', '_nx',
+                 '_ny', '_w', '_h', '_wlookup', '_blk_info', '_hash')
+
     def __init__(self, parent_grid: RoutingGrid, wire_specs: Mapping[int, Any],
                  tr_widths: WDictType, tr_spaces: SpDictType, top_layer: int, nx: int, ny: int,
                  tech_cls: T, *, conn_layer: Optional[int] = None,
@@ -165,6 +168,7 @@ class ArrayBase(TemplateBase, abc.ABC):
         TemplateBase.__init__(self, temp_db, params, **kwargs)
         self._info: Optional[ArrayPlaceInfo] = None
         self._unit: Optional[ArrayUnit] = None
+        self._port_table: Dict[str, WireArray] = {}
 
     @property
     def tech_cls(self) -> ArrayTech:
@@ -193,6 +197,7 @@ class ArrayBase(TemplateBase, abc.ABC):
     def draw_base(self, info: ArrayPlaceInfo) -> ArrayUnit:
         self._info = info
         self.grid = info.grid
+        self._port_table.clear()
 
         self._unit = master = self.new_template(ArrayUnit, params=dict(desc=self.tech_cls.desc,
                                                                        blk_info=info.blk_info))
@@ -253,4 +258,8 @@ class ArrayBase(TemplateBase, abc.ABC):
 
         xform = Transform(dx, dy, orient)
 
-        return self._unit.get_port(name).get_pins()[0].get_transform(xform)
+        # the unit port is the same for every (xidx, yidx), so only look it up once.
+        warr = self._port_table.get(name, None)
+        if warr is None:
+            warr = self._port_table[name] = self._unit.get_port(name).get_pins()[0]
+        return warr.get_transform(xform)
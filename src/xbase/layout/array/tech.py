@@ -40,6 +40,8 @@ WireDictType = ImmutableSortedDict[Tuple[str, int], Tuple[HalfInt, str]]
 
 
 class ArrayTech(abc.ABC):
+    __slots__ = ('_tech_info', '_kwargs')
+
     def __init__(self, tech_info: TechInfo, dev_name: str, **kwargs: Any) -> None:
         self._tech_info = tech_info
         kwargs['dev_name'] = dev_name
@@ -27,6 +27,8 @@ from .tech import DiodeTech
 
 
 class DiodeBasePlaceInfo(ArrayPlaceInfo):
+    __slots__ = ()
+
     def __init__(self, parent_grid: RoutingGrid, wire_specs: Mapping[int, Any],
                  tr_widths: WDictType, tr_spaces: SpDictType, top_layer: int, nx: int, ny: int, *,
                  conn_layer: Optional[int] = None, dio_type: str = '',
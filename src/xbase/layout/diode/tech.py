@@ -28,6 +28,8 @@ from ..array.tech import ArrayTech
 
 
 class DiodeTech(ArrayTech, abc.ABC):
+    __slots__ = ('_dio_config',)
+
     def __init__(self, tech_info: TechInfo, dio_type: str = '') -> None:
         ArrayTech.__init__(self, tech_info, 'diode', dio_type=dio_type)
 
@@ -32,6 +32,9 @@ from ..enum import MOSType, MOSWireType, MOSPortType, Alignment
 @dataclass(eq=True, frozen=True, init=False)
 class MOSRowSpecs:
     """specification for a transistor row."""
+    __slots__ = ('mos_type', 'width', 'threshold', 'bot_wires', 'top_wires', 'options', 'flip',
+                 'sub_width')
+
     mos_type: MOSType
     width: int
     threshold: str
@@ -58,6 +61,14 @@ class MOSRowSpecs:
         object.__setattr__(self, 'flip', flip)
         object.__setattr__(self, 'sub_width', sub_width)
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        # frozen dataclasses with __slots__ cannot be unpickled with setattr()
+        for name, val in zip(self.__slots__, state):
+            object.__setattr__(self, name, val)
+
     @classmethod
     def make_row_specs(cls, val: Mapping[str, Any]) -> MOSRowSpecs:
         mos_type = MOSType[val['mos_type']]
@@ -27,6 +27,8 @@ from .tech import ResTech
 
 
 class ResBasePlaceInfo(ArrayPlaceInfo):
+    __slots__ = ('_res_type', '_mos_type', '_threshold')
+
     def __init__(self, parent_grid: RoutingGrid, wire_specs: Mapping[int, Any],
                  tr_widths: WDictType, tr_spaces: SpDictType, top_layer: int, nx: int, ny: int, *,
                  conn_layer: Optional[int] = None, res_type: str = 'standard', mos_type: str = '',
@@ -50,12 +52,20 @@ class ResBasePlaceInfo(ArrayPlaceInfo):
         self._mos_type = mos_type
         self._threshold = threshold
 
+    # defining __eq__ removes the inherited __hash__, so restore it.  The hash already covers
+    # res_type/mos_type/threshold through the block options.
+    __hash__ = ArrayPlaceInfo.__hash__
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        # compare the cheap string fields before the full array comparison
         # noinspection PyProtectedMember
-        return (ArrayPlaceInfo.__eq__(self, other) and
+        return (isinstance(other, self.__class__) and
                 self._res_type == other._res_type and
                 self._mos_type == other._mos_type and
-                self._threshold == other._threshold)
+                self._threshold == other._threshold and
+                ArrayPlaceInfo.__eq__(self, other))
 
     @classmethod
     def get_tech_cls(cls, tech_info: TechInfo, **kwargs: Any) -> ResTech:
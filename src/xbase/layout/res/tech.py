@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Optional
 
 import abc
 
@@ -28,9 +28,15 @@ from ..array.tech import ArrayTech
 
 
 class ResTech(ArrayTech, abc.ABC):
+    __slots__ = ('_res_config', '_conn_layer', '_mos_type_default', '_threshold_default')
+
     def __init__(self, tech_info: TechInfo, metal: bool = False) -> None:
         ArrayTech.__init__(self, tech_info, 'res', metal=metal)
         self._res_config = tech_info.config['res_metal' if metal else 'res']
+        self._conn_layer: int = self._res_config['conn_layer']
+        # these entries are optional in some tech configs, so only read them when needed
+        self._mos_type_default: Optional[str] = None
+        self._threshold_default: Optional[str] = None
 
     @property
     def res_config(self) -> Mapping[str, Any]:
@@ -38,12 +44,16 @@ class ResTech(ArrayTech, abc.ABC):
 
     @property
     def conn_layer(self) -> int:
-        return self._res_config['conn_layer']
+        return self._conn_layer
 
     @property
     def mos_type_default(self) -> str:
-        return self._res_config['mos_type_default']
+        if self._mos_type_default is None:
+            self._mos_type_default = self._res_config['mos_type_default']
+        return self._mos_type_default
 
     @property
     def threshold_default(self) -> str:
-        return self._res_config['threshold_default']
+        if self._threshold_default is None:
+            self._threshold_default = self._res_config['threshold_default']
+        return self._threshold_default
@@ -16,10 +16,12 @@
 from __future__ import annotations
 
 from typing import (
-    Tuple, Any, Iterable, List, Optional, Set, Mapping, Dict, Sequence, Union, Callable
+    Tuple, Any, Iterable, List, Optional, Set, Mapping, Dict, Sequence, Union, Callable, FrozenSet
 )
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from networkx import DiGraph, NetworkXUnfeasible
 from networkx.algorithms.dag import topological_sort
@@ -35,6 +37,10 @@ from bag.layout.routing.grid import RoutingGrid
 
 from .enum import Alignment
 
+# matches bus names of the form basename<start>, basename<start:stop>, or
+# basename<start:stop:step>
+_BUS_NAME_RE = re.compile(r'([^<:]*)<(-?\d+)(?::(-?\d+)(?::(-?\d+))?)?>')
+
 
 class WireLookup:
     def __init__(self, data: Dict[Tuple[str, int], Tuple[HalfInt, int]],
@@ -42,14 +48,15 @@ class WireLookup:
         self._data: ImmutableSortedDict[Tuple[str, int],
                                         Tuple[HalfInt, int]] = ImmutableSortedDict(data)
         if ranges is None:
+            # keys are sorted, so the first index of each name is the minimum and the last
+            # index is the maximum.
             self._ranges = {}
-            for name, idx in data.keys():
+            for name, idx in self._data.keys():
                 cur_range = self._ranges.get(name, None)
                 if cur_range is None:
                     self._ranges[name] = [idx, idx]
                 else:
-                    cur_range[0] = min(cur_range[0], idx)
-                    cur_range[1] = max(cur_range[1], idx)
+                    cur_range[1] = idx
         else:
             self._ranges = ranges
 
@@ -93,9 +100,10 @@ class WireLookup:
 
     def get_wire_margin_info(self, grid: RoutingGrid, layer: int, yl: int, yh: int, top_edge: bool,
                              shared: Sequence[str]) -> Tuple[int, List[Tuple[str, int]]]:
-        shared_set = _get_shared_set(shared)
+        shared_set = _get_shared_set(tuple(shared))
         ans = []
         y_conn = yl if top_edge else yh
+        vext_table: Dict[int, int] = {}
         for name_tuple, (tidx, width) in self._data.items():
             if name_tuple in shared_set:
                 continue
@@ -104,7 +112,10 @@ class WireLookup:
             margin = yh - coord if top_edge else coord - yl
             ans.append((name_tuple[0], margin))
 
-            via_ext = grid.get_via_extensions(Direction.UPPER, layer, width, 1)[0]
+            via_ext = vext_table.get(width, None)
+            if via_ext is None:
+                via_ext = vext_table[width] = grid.get_via_extensions(Direction.UPPER, layer,
+                                                                      width, 1)[0]
             wl, wu = grid.get_wire_bounds(layer, tidx, width)
             if top_edge:
                 y_conn = max(y_conn, wu + via_ext)
@@ -115,21 +126,24 @@ class WireLookup:
         return y_conn_margin, ans
 
     def get_move(self, tr_idx: HalfInt, shared: Sequence[str]) -> WireLookup:
-        shared_set = _get_shared_set(shared)
-        new_data = {}
-        for name_tuple, (tidx, width) in self._data.items():
-            if name_tuple in shared_set:
-                new_data[name_tuple] = (tidx, width)
-            else:
-                new_data[name_tuple] = (tidx + tr_idx, width)
+        if tr_idx == 0:
+            # WireLookup is immutable, no need to copy
+            return self
+
+        shared_set = _get_shared_set(tuple(shared))
+        new_data = {name_tuple: (val if name_tuple in shared_set else (val[0] + tr_idx, val[1]))
+                    for name_tuple, val in self._data.items()}
         return WireLookup(new_data, ranges=self._ranges)
 
     def get_move_shared(self, tr_idx: HalfInt, shared: Sequence[str]) -> WireLookup:
+        if tr_idx == 0 or not shared:
+            return self
+
         new_data = self._data.to_dict()
         for name in shared:
             basename, idx_list = _parse_cdba_name(name)
             for idx in idx_list:
-                key = (name, idx)
+                key = (basename, idx)
                 val = new_data.get(key, None)
                 if val is not None:
                     new_data[key] = (val[0] + tr_idx, val[1])
@@ -167,32 +181,12 @@ class WireData:
         wire_data : WireData
             the wire graph specification dataclass.
         """
-        if isinstance(wire_data, Mapping):
-            actual_data = wire_data['data']
-            alignment = Alignment[wire_data.get('align', alignment.name)]
-            shared_wires = wire_data.get('shared', [])
-        else:
-            actual_data = wire_data
-            shared_wires = []
-
-        wire_grps = []
-        for wire_grp, align in _wire_list_iter(actual_data, alignment):
-            wire_list = []
-            for winfo in wire_grp:
-                if isinstance(winfo, str):
-                    name = winfo
-                    wtype = ''
-                    ptype = ptype_default
-                else:
-                    name: str = winfo[0]
-                    ptype: str = winfo[1]
-                    wtype: str = '' if len(winfo) < 3 else winfo[2]
-                    if not ptype:
-                        ptype = ptype_default
-                wire_list.append((name, ptype, wtype))
-            wire_grps.append((ImmutableList(wire_list), align))
-
-        return WireData(ImmutableList(wire_grps), ImmutableList(shared_wires))
+        try:
+            hash(wire_data)
+        except TypeError:
+            # mutable specification, cannot reuse previous results
+            return _make_wire_data(wire_data, alignment, ptype_default)
+        return _make_wire_data_cached(wire_data, alignment, ptype_default)
 
 
 class WireGraph:
@@ -203,6 +197,27 @@ class WireGraph:
         self._has_center = has_center
         self._lower = COORD_MAX
         self._upper = COORD_MIN
+        # graph topology is fixed after construction, so cache adjacency in plain tuples
+        # instead of going through networkx degree/neighbor views in the placement loops.
+        self._pred: Dict[Tuple[str, int], Tuple[Tuple[str, int], ...]] = {
+            node: tuple(nbrs) for node, nbrs in graph.pred.items()}
+        self._succ: Dict[Tuple[str, int], Tuple[Tuple[str, int], ...]] = {
+            node: tuple(nbrs) for node, nbrs in graph.succ.items()}
+        self._topo_order: Optional[List[Tuple[str, int]]] = None
+        self._topo_index: Optional[Dict[Tuple[str, int], int]] = None
+        # map from wire to its attribute dictionary.  These are the same dictionaries stored in
+        # the networkx graph, but plain dictionary lookups avoid the NodeView indirection.
+        self._attrs: Dict[Tuple[str, int], Dict[str, Any]] = dict(graph.nodes(data=True))
+        # shared wires with no successors are placed on the upper edge, all other shared wires
+        # are placed on the lower edge.
+        self._shared_upper: List[Tuple[str, int]] = []
+        self._shared_lower: List[Tuple[str, int]] = []
+        for wire, attrs in self._attrs.items():
+            if attrs['shared']:
+                if self._succ[wire]:
+                    self._shared_lower.append(wire)
+                else:
+                    self._shared_upper.append(wire)
 
     def __bool__(self) -> bool:
         return len(self._graph) != 0
@@ -236,55 +251,71 @@ class WireGraph:
     def lower(self) -> int:
         return self._lower
 
+    def _get_topo_order(self) -> List[Tuple[str, int]]:
+        if self._topo_order is None:
+            try:
+                self._topo_order = list(topological_sort(self._graph))
+            except NetworkXUnfeasible:
+                raise ValueError('dependency loop detected.  Cannot place wires.')
+        return self._topo_order
+
+    def _get_topo_index(self) -> Dict[Tuple[str, int], int]:
+        if self._topo_index is None:
+            self._topo_index = {wire: idx for idx, wire in enumerate(self._get_topo_order())}
+        return self._topo_index
+
     @property
     def sinks(self) -> List[Tuple[HalfInt, str]]:
-        # NOTE: pycharm typehint bug
-        # noinspection PyCallingNonCallable
         return [(attrs['idx'], attrs['wtype'])
-                for key, attrs in self._graph.nodes.items() if self._graph.out_degree(key) == 0]
+                for key, attrs in self._attrs.items() if not self._succ[key]]
 
     def get_wire_lookup(self) -> WireLookup:
         return WireLookup({key: (attrs['idx'], attrs['width'])
-                           for key, attrs in self._graph.nodes.items()})
+                           for key, attrs in self._attrs.items()})
 
     def get_placement_bounds(self, layer: int, grid: RoutingGrid,
                              inc_shared: bool = True) -> Dict[str, List[Tuple[HalfInt, int]]]:
         ans = {}
-        for key, attrs in self._graph.nodes.items():
+        # map from placement type to the current lower/upper wire bound coordinates
+        coord_table: Dict[str, List[int]] = {}
+        for key, attrs in self._attrs.items():
             if attrs['shared'] and not inc_shared:
                 continue
 
             ptype: str = attrs['ptype']
             cur_info = (attrs['idx'], attrs['width'])
+            lower, upper = grid.get_wire_bounds(layer, cur_info[0], width=cur_info[1])
 
             cur_bnds = ans.get(ptype, None)
             if cur_bnds is None:
                 ans[ptype] = [cur_info, cur_info]
+                coord_table[ptype] = [lower, upper]
             else:
-                lower, upper = grid.get_wire_bounds(layer, cur_info[0], width=cur_info[1])
-                cur_lower = grid.get_wire_bounds(layer, cur_bnds[0][0], width=cur_bnds[0][1])[0]
-                cur_upper = grid.get_wire_bounds(layer, cur_bnds[1][0], width=cur_bnds[1][1])[1]
-                if lower < cur_lower:
+                cur_coords = coord_table[ptype]
+                if lower < cur_coords[0]:
                     cur_bnds[0] = cur_info
-                if upper > cur_upper:
+                    cur_coords[0] = lower
+                if upper > cur_coords[1]:
                     cur_bnds[1] = cur_info
+                    cur_coords[1] = upper
 
         return ans
 
     def get_shared_conn_y(self, layer: int, grid: RoutingGrid, top_edge: bool) -> int:
         ans = COORD_MAX if top_edge else COORD_MIN
-        for wire, attrs in self._graph.nodes.items():
-            # NOTE: pycharm typehint bug
-            # noinspection PyCallingNonCallable
-            is_sink = (self._graph.out_degree(wire) == 0)
-            if attrs['shared'] and is_sink == top_edge:
-                ntr = attrs['width']
-                vext = grid.get_via_extensions(Direction.UPPER, layer, ntr, 1)[0]
-                wl, wu = grid.get_wire_bounds(layer, attrs['idx'], width=ntr)
-                if top_edge:
-                    ans = min(ans, wl - vext)
-                else:
-                    ans = max(ans, wu + vext)
+        vext_table: Dict[int, int] = {}
+        node_view = self._attrs
+        for wire in (self._shared_upper if top_edge else self._shared_lower):
+            attrs = node_view[wire]
+            ntr = attrs['width']
+            vext = vext_table.get(ntr, None)
+            if vext is None:
+                vext = vext_table[ntr] = grid.get_via_extensions(Direction.UPPER, layer, ntr, 1)[0]
+            wl, wu = grid.get_wire_bounds(layer, attrs['idx'], width=ntr)
+            if top_edge:
+                ans = min(ans, wl - vext)
+            else:
+                ans = max(ans, wu + vext)
         return ans
 
     def set_upper(self, layer: int, tr_manager: TrackManager, val: int) -> None:
@@ -295,11 +326,9 @@ class WireGraph:
         if new_val < self._upper:
             raise ValueError(f'set_upper cannot reduce upper bound from {self._upper} to {new_val}')
         self._upper = new_val
-        for wire, attrs in self._graph.nodes.items():
-            # NOTE: pycharm typehint bug
-            # noinspection PyCallingNonCallable
-            if attrs['shared'] and self._graph.out_degree(wire) == 0:
-                attrs['idx'] = tr_last
+        node_view = self._attrs
+        for wire in self._shared_upper:
+            node_view[wire]['idx'] = tr_last
 
     def place_compact(self, layer: int, tr_manager: TrackManager, lower: int = 0,
                       bot_mirror: bool = False, top_mirror: bool = False,
@@ -357,97 +386,116 @@ class WireGraph:
             top Y coordinate of the bottom vertical wire.
         """
         grid = tr_manager.grid
-        node_view = self._graph.nodes
+        node_view = self._attrs
+        pred_table = self._pred
+        succ_table = self._succ
+        # bind frequently used methods to locals for the placement loops
+        find_next_track = grid.find_next_track
+        get_next_track = tr_manager.get_next_track
         empty_set = set()
         tr0 = grid.coord_to_track(layer, lower)
         prev_sinks: List[Tuple[HalfInt, str]] = [] if prev_wg is None else prev_wg.sinks
+        # get_sep() results only depend on the wire types, cache them for this placement.
+        sep_table: Dict[Tuple[str, str, bool], HalfInt] = {}
+        # minimum track index of source wires above prev_wg, for each wire type
+        prev_table: Dict[str, HalfInt] = {}
 
         # compute wire placement
         src_list = []
         sink_list = []
         conn_sp_le = grid.get_line_end_space(layer - 1, 1, even=False)
-        try:
-            for key in topological_sort(self._graph):
-                cur_attrs = node_view[key]
-                wtype: str = cur_attrs['wtype']
-                ptype: str = cur_attrs['ptype']
-                tr_w: int = cur_attrs['width']
-                shared: bool = cur_attrs['shared']
-                even_set: Optional[Set[Tuple[str, int]]] = cur_attrs['even_spaces']
-                if even_set is None:
-                    even_set = empty_set
-
-                cur_idx = grid.find_next_track(layer, lower, tr_width=tr_w,
-                                               half_track=True, mode=RoundMode.GREATER_EQ)
-                if pcons is not None:
-                    cur_idx = pcons(ptype, tr_w, cur_idx)
-                # NOTE: pycharm typehint bug
-                # noinspection PyCallingNonCallable
-                is_sink = (self._graph.out_degree(key) == 0)
-                if is_sink:
-                    sink_list.append(key)
-                # NOTE: pycharm typehint bug
-                # noinspection PyCallingNonCallable
-                if self._graph.in_degree(key) == 0:
-                    src_list.append(key)
-                    if shared:
-                        cur_idx = tr0
-                    else:
-                        for prev_idx, prev_wtype in prev_sinks:
-                            min_idx = tr_manager.get_next_track(layer, prev_idx, prev_wtype,
-                                                                wtype, up=True)
-                            cur_idx = max(cur_idx, min_idx)
-
-                        if bot_mirror:
-                            # set root starting index so we satisfy self-mirror constraint
-                            sep = tr_manager.get_sep(layer, (wtype, wtype), same_color=True,
-                                                     half_space=False)
-                            cur_idx = max(cur_idx, sep.div2())
-
-                        cur_idx += shift
+        for key in self._get_topo_order():
+            cur_attrs = node_view[key]
+            wtype: str = cur_attrs['wtype']
+            ptype: str = cur_attrs['ptype']
+            tr_w: int = cur_attrs['width']
+            shared: bool = cur_attrs['shared']
+            even_set: Optional[Set[Tuple[str, int]]] = cur_attrs['even_spaces']
+            if even_set is None:
+                even_set = empty_set
+
+            cur_idx = find_next_track(layer, lower, tr_width=tr_w,
+                                      half_track=True, mode=RoundMode.GREATER_EQ)
+            if pcons is not None:
+                cur_idx = pcons(ptype, tr_w, cur_idx)
+            is_sink = not succ_table[key]
+            if is_sink:
+                sink_list.append(key)
+            parents = pred_table[key]
+            if not parents:
+                src_list.append(key)
+                if shared:
+                    cur_idx = tr0
                 else:
-                    if is_sink and shared and ytop_conn is not None:
-                        # handle line-end spacing between ytop_conn and wires from above connected
-                        # to this shared wire.
-                        vext = grid.get_via_extensions(Direction.UPPER, layer, tr_w, 1)[0]
-                        min_yl = ytop_conn + conn_sp_le + vext
-                        cur_idx = max(cur_idx, grid.find_next_track(layer, min_yl, tr_width=tr_w,
-                                                                    mode=RoundMode.GREATER_EQ))
-                    for parent in self._graph.predecessors(key):
-                        par_attrs = node_view[parent]
-                        par_idx: HalfInt = par_attrs['idx']
-                        par_type: str = par_attrs['wtype']
-
-                        half_space = parent not in even_set
-                        min_idx = tr_manager.get_next_track(layer, par_idx, par_type, wtype,
-                                                            half_space=half_space)
+                    if prev_sinks:
+                        min_idx = prev_table.get(wtype, None)
+                        if min_idx is None:
+                            min_idx = prev_table[wtype] = max(
+                                get_next_track(layer, prev_idx, prev_wtype, wtype, up=True)
+                                for prev_idx, prev_wtype in prev_sinks)
                         cur_idx = max(cur_idx, min_idx)
 
-                cur_attrs['idx'] = cur_idx
-
-        except NetworkXUnfeasible:
-            raise ValueError('dependency loop detected.  Cannot place wires.')
+                    if bot_mirror:
+                        # set root starting index so we satisfy self-mirror constraint
+                        sep_key = (wtype, wtype, False)
+                        sep = sep_table.get(sep_key, None)
+                        if sep is None:
+                            sep = sep_table[sep_key] = tr_manager.get_sep(layer, (wtype, wtype),
+                                                                          same_color=True,
+                                                                          half_space=False)
+                        cur_idx = max(cur_idx, sep.div2())
+
+                    cur_idx += shift
+            else:
+                if is_sink and shared and ytop_conn is not None:
+                    # handle line-end spacing between ytop_conn and wires from above connected
+                    # to this shared wire.
+                    vext = grid.get_via_extensions(Direction.UPPER, layer, tr_w, 1)[0]
+                    min_yl = ytop_conn + conn_sp_le + vext
+                    cur_idx = max(cur_idx, find_next_track(layer, min_yl, tr_width=tr_w,
+                                                           mode=RoundMode.GREATER_EQ))
+                for parent in parents:
+                    par_attrs = node_view[parent]
+                    par_idx: HalfInt = par_attrs['idx']
+                    par_type: str = par_attrs['wtype']
+
+                    half_space = parent not in even_set
+                    min_idx = get_next_track(layer, par_idx, par_type, wtype,
+                                             half_space=half_space)
+                    cur_idx = max(cur_idx, min_idx)
+
+            cur_attrs['idx'] = cur_idx
 
         if bot_mirror:
             # check that we satisfy bottom edge mirror placement constraint
-            # first, get all violations
-            num_src = len(src_list)
+            # first, get all violations.  The mirror spacing between two sources only depends on
+            # their wire types and the sum of their track indices, so we only need to check the
+            # lowest sources of each wire type.
+            src_table: Dict[str, List[Tuple[HalfInt, Tuple[str, int]]]] = {}
+            for wire in src_list:
+                attrs = node_view[wire]
+                if not attrs['shared']:
+                    src_table.setdefault(attrs['wtype'], []).append((attrs['idx'], wire))
+            for info_list in src_table.values():
+                info_list.sort(key=lambda v: v[0])
+
+            wtype_list = list(src_table.keys())
+            num_wtype = len(wtype_list)
             violations = []
             move_set = set()
-            for ni in range(num_src):
-                wire_i = src_list[ni]
-                attrs_i = node_view[wire_i]
-                if attrs_i['shared']:
-                    continue
-                idx_i = attrs_i['idx']
-                wtype_i = attrs_i['wtype']
-                for nj in range(ni + 1, num_src):
-                    wire_j = src_list[nj]
-                    attrs_j = node_view[wire_j]
-                    if attrs_j['shared']:
-                        continue
-                    idx_j = attrs_i['idx']
-                    wtype_j = attrs_j['wtype']
+            for ti in range(num_wtype):
+                wtype_i = wtype_list[ti]
+                info_i = src_table[wtype_i]
+                for tj in range(ti, num_wtype):
+                    wtype_j = wtype_list[tj]
+                    if ti == tj:
+                        if len(info_i) < 2:
+                            continue
+                        idx_i, wire_i = info_i[0]
+                        idx_j, wire_j = info_i[1]
+                    else:
+                        idx_i, wire_i = info_i[0]
+                        idx_j, wire_j = src_table[wtype_j][0]
 
                     sep = tr_manager.get_sep(layer, (wtype_i, wtype_j), same_color=True,
                                              half_space=True)
@@ -472,6 +520,37 @@ class WireGraph:
         upper_is_shared = False
         num_sinks = len(sink_list)
         tr_pitch = grid.get_track_pitch(layer)
+        mirror_bnd_list: List[int] = []
+        if top_mirror:
+            # each sink must be DRC clean with the mirror image of itself and all non-shared sinks
+            # after it.  The bound is monotonic in the other sink's track index, so we only need
+            # the maximum track index of each wire type, which we accumulate in a backward pass.
+            mirror_bnd_list = [COORD_MIN] * num_sinks
+            comp_table: Dict[str, HalfInt] = {}
+            for sink_idx in range(num_sinks - 1, -1, -1):
+                cur_attrs = node_view[sink_list[sink_idx]]
+                if cur_attrs['shared']:
+                    continue
+                wtype: str = cur_attrs['wtype']
+                cur_idx: HalfInt = cur_attrs['idx']
+                comp_idx = comp_table.get(wtype, None)
+                if comp_idx is None or cur_idx > comp_idx:
+                    comp_table[wtype] = cur_idx
+
+                bnd_c = COORD_MIN
+                for comp_wtype, comp_idx in comp_table.items():
+                    # TODO: pessimistic spacing rule, figure out coloring?
+                    sep_key = (wtype, comp_wtype, True)
+                    sep = sep_table.get(sep_key, None)
+                    if sep is None:
+                        sep = sep_table[sep_key] = tr_manager.get_sep(
+                            layer, (wtype, comp_wtype), same_color=True, half_space=True)
+                    ntr_dbl = sep + cur_idx + comp_idx
+                    bnd_c = max(bnd_c, -(-int(ntr_dbl * tr_pitch) // 2))
+                mirror_bnd_list[sink_idx] = bnd_c
+
+        track_to_coord = grid.track_to_coord
+        get_wire_bounds = grid.get_wire_bounds
         for sink_idx, sink in enumerate(sink_list):
             cur_attrs = node_view[sink]
             tr_w: int = cur_attrs['width']
@@ -480,25 +559,14 @@ class WireGraph:
 
             # update upper most coordinate
             if shared:
-                mid_c = grid.track_to_coord(layer, cur_idx)
+                mid_c = track_to_coord(layer, cur_idx)
                 if mid_c >= upper:
                     upper = mid_c
                     upper_is_shared = True
             else:
-                bnd_c = grid.get_wire_bounds(layer, cur_idx, width=tr_w)[1]
+                bnd_c = get_wire_bounds(layer, cur_idx, width=tr_w)[1]
                 if top_mirror:
-                    wtype: str = cur_attrs['wtype']
-                    for comp_sink_idx in range(sink_idx, num_sinks):
-                        comp_attrs = node_view[sink_list[comp_sink_idx]]
-                        comp_shared: bool = comp_attrs['shared']
-                        comp_wtype: str = comp_attrs['wtype']
-                        comp_idx: HalfInt = comp_attrs['idx']
-                        if not comp_shared:
-                            # TODO: pessimistic spacing rule, figure out coloring?
-                            sep = tr_manager.get_sep(layer, (wtype, comp_wtype), same_color=True,
-                                                     half_space=True)
-                            ntr_dbl = sep + cur_idx + comp_idx
-                            bnd_c = max(bnd_c, -(-int(ntr_dbl * tr_pitch) // 2))
+                    bnd_c = max(bnd_c, mirror_bnd_list[sink_idx])
 
                 if bnd_c > upper:
                     upper = bnd_c
@@ -514,17 +582,14 @@ class WireGraph:
 
         # move upper shared wires
         tr_last = grid.coord_to_track(layer, self._upper)
-        for wire in sink_list:
-            attrs = node_view[wire]
-            # NOTE: pycharm typehint bug
-            # noinspection PyCallingNonCallable
-            if attrs['shared'] and self._graph.out_degree(wire) == 0:
-                attrs['idx'] = tr_last
+        for wire in self._shared_upper:
+            node_view[wire]['idx'] = tr_last
 
     def align_wires(self, layer: int, tr_manager: TrackManager, lower: int, upper: int,
                     top_pcons: Optional[Callable[[str, int, HalfInt], HalfInt]] = None) -> None:
         grid = tr_manager.grid
-        node_view = self._graph.nodes
+        node_view = self._attrs
+        move = self._move
 
         for key, attrs in node_view.items():
             attrs['harden'] = False
@@ -534,10 +599,10 @@ class WireGraph:
         for wire_list, alignment in self._align_specs:
             if alignment is Alignment.LOWER_COMPACT:
                 for wire in wire_list:
-                    self._move(layer, tr_manager, lower, upper, wire, top_pcons, True, False)
+                    move(layer, tr_manager, lower, upper, wire, top_pcons, True, False)
             elif alignment is Alignment.UPPER_COMPACT:
                 for wire in reversed(wire_list):
-                    self._move(layer, tr_manager, lower, upper, wire, top_pcons, True, True)
+                    move(layer, tr_manager, lower, upper, wire, top_pcons, True, True)
             elif alignment is Alignment.CENTER_COMPACT:
                 # check if some wires are hardened already
                 hard_idx_list = [idx for idx, wire in enumerate(wire_list)
@@ -548,11 +613,10 @@ class WireGraph:
                     # for all wires above, move down
                     center_idx = hard_idx_list[num_hard // 2]
                     for idx in range(center_idx - 1, -1, -1):
-                        self._move(layer, tr_manager, lower, upper, wire_list[idx], top_pcons,
-                                   True, True)
+                        move(layer, tr_manager, lower, upper, wire_list[idx], top_pcons, True, True)
                     for idx in range(center_idx + 1, len(wire_list)):
-                        self._move(layer, tr_manager, lower, upper, wire_list[idx], top_pcons,
-                                   True, False)
+                        move(layer, tr_manager, lower, upper, wire_list[idx], top_pcons, True,
+                             False)
                 else:
                     # center entire group
                     cur_idx = grid.get_middle_track(node_view[wire_list[0]]['idx'],
@@ -574,58 +638,82 @@ class WireGraph:
     def _move(self, layer: int, tr_manager: TrackManager, lower: int, upper, wire: Tuple[str, int],
               top_pcons: Optional[Callable[[str, int, HalfInt], HalfInt]], harden: bool, up: bool
               ) -> None:
-        node_view = self._graph.nodes
+        node_view = self._attrs
+        if node_view[wire]['harden']:
+            return
+
+        # find all wires that need to be placed again: every wire that is not hardened and is
+        # reachable from this wire in the move direction.  Shared wires snap to the edges, so we
+        # do not search past them.
+        nbr_table = self._succ if up else self._pred
+        move_set = {wire}
+        stack = [wire]
+        while stack:
+            cur_wire = stack.pop()
+            if not node_view[cur_wire]['shared']:
+                for node in nbr_table[cur_wire]:
+                    if node not in move_set and not node_view[node]['harden']:
+                        move_set.add(node)
+                        stack.append(node)
+
+        # place wires in topological order, so every wire is placed after its neighbors
+        topo_index = self._get_topo_index()
+        place_wire = self._place_wire
+        for node in sorted(move_set, key=topo_index.__getitem__, reverse=up):
+            place_wire(layer, tr_manager, lower, upper, node, top_pcons, harden and node == wire,
+                       up)
+
+    def _place_wire(self, layer: int, tr_manager: TrackManager, lower: int, upper,
+                    wire: Tuple[str, int],
+                    top_pcons: Optional[Callable[[str, int, HalfInt], HalfInt]], harden: bool,
+                    up: bool) -> None:
+        node_view = self._attrs
         attrs = node_view[wire]
+        grid = tr_manager.grid
 
-        if not attrs['harden']:
-            grid = tr_manager.grid
-
-            wtype: str = attrs['wtype']
-            ptype: str = attrs['ptype']
-            tr_w: int = attrs['width']
-            shared: bool = attrs['shared']
-            even_set: Optional[Set[Tuple[str, int]]] = attrs['even_spaces']
+        wtype: str = attrs['wtype']
+        ptype: str = attrs['ptype']
+        tr_w: int = attrs['width']
+        shared: bool = attrs['shared']
+        even_set: Optional[Set[Tuple[str, int]]] = attrs['even_spaces']
 
-            if shared:
-                # snap boundary shared wires to edges
-                # NOTE: pycharm typehint bug
-                # noinspection PyCallingNonCallable
-                if self._graph.out_degree(wire) == 0:
-                    cur_idx = grid.coord_to_track(layer, upper)
-                else:
-                    cur_idx = grid.coord_to_track(layer, lower)
-                attrs['idx'] = cur_idx
-                attrs['harden'] = True
+        if shared:
+            # snap boundary shared wires to edges
+            if not self._succ[wire]:
+                cur_idx = grid.coord_to_track(layer, upper)
+            else:
+                cur_idx = grid.coord_to_track(layer, lower)
+            attrs['idx'] = cur_idx
+            attrs['harden'] = True
+        else:
+            if up:
+                cur_idx = grid.find_next_track(layer, upper, tr_width=tr_w, half_track=True,
+                                               mode=RoundMode.LESS_EQ)
+                if top_pcons is not None:
+                    cur_idx = top_pcons(ptype, tr_w, cur_idx)
+                node_iter = self._succ[wire]
+                fun = min
             else:
+                cur_idx = grid.find_next_track(layer, lower, tr_width=tr_w, half_track=True,
+                                               mode=RoundMode.GREATER_EQ)
+                node_iter = self._pred[wire]
+                fun = max
+            for node in node_iter:
+                node_attrs = node_view[node]
+                node_type: str = node_attrs['wtype']
+                node_idx: HalfInt = node_attrs['idx']
                 if up:
-                    cur_idx = grid.find_next_track(layer, upper, tr_width=tr_w, half_track=True,
-                                                   mode=RoundMode.LESS_EQ)
-                    if top_pcons is not None:
-                        cur_idx = top_pcons(ptype, tr_w, cur_idx)
-                    node_iter = self._graph.successors(wire)
-                    fun = min
+                    eset = node_attrs['even_spaces']
+                    half_space = eset is None or wire not in eset
                 else:
-                    cur_idx = grid.find_next_track(layer, lower, tr_width=tr_w, half_track=True,
-                                                   mode=RoundMode.GREATER_EQ)
-                    node_iter = self._graph.predecessors(wire)
-                    fun = max
-                for node in node_iter:
-                    self._move(layer, tr_manager, lower, upper, node, top_pcons, False, up)
-                    node_attrs = node_view[node]
-                    node_type: str = node_attrs['wtype']
-                    node_idx: HalfInt = node_attrs['idx']
-                    if up:
-                        eset = node_attrs['even_spaces']
-                        half_space = eset is None or wire not in eset
-                    else:
-                        half_space = even_set is None or node not in even_set
-                    next_idx = tr_manager.get_next_track(layer, node_idx, node_type, wtype,
-                                                         half_space=half_space, up=not up)
+                    half_space = even_set is None or node not in even_set
+                next_idx = tr_manager.get_next_track(layer, node_idx, node_type, wtype,
+                                                     half_space=half_space, up=not up)
 
-                    cur_idx = fun(cur_idx, next_idx)
+                cur_idx = fun(cur_idx, next_idx)
 
-                attrs['idx'] = cur_idx
-                attrs['harden'] = harden
+            attrs['idx'] = cur_idx
+            attrs['harden'] = harden
 
 
 class WireGraphBuilder:
@@ -699,31 +787,38 @@ class WireGraphBuilder:
         cur_attrs['shared'] = True
 
     def get_graph(self, layer: int, tr_manager: TrackManager) -> WireGraph:
-        for _, attrs in self._graph.nodes.items():
-            attrs['width'] = tr_manager.get_width(layer, attrs['wtype'])
+        # many wires share the same wire type, so only compute each width once
+        width_table: Dict[str, int] = {}
+        for _, attrs in self._graph.nodes(data=True):
+            wtype: str = attrs['wtype']
+            width = width_table.get(wtype, None)
+            if width is None:
+                width = width_table[wtype] = tr_manager.get_width(layer, wtype)
+            attrs['width'] = width
         return WireGraph(self._graph, self._align_specs, self._has_center)
 
     def _is_even_symmetric(self, wlist: List[Tuple[str, int]]) -> bool:
-        num = len(wlist)
-        for idx in range(0, num // 2):
-            if (self._graph.nodes[wlist[idx]]['wtype'] !=
-                    self._graph.nodes[wlist[num - 1 - idx]]['wtype']):
-                return False
-        return True
+        node_view = self._graph.nodes
+        wtype_list = [node_view[wire]['wtype'] for wire in wlist]
+        nhalf = len(wtype_list) // 2
+        # compare first half with the reversed second half
+        return wtype_list[:nhalf] == wtype_list[:-nhalf - 1:-1]
 
 
 @dataclass
 class WireSpecs:
+    __slots__ = ('min_size', 'blk_size', 'graph_list')
+
     min_size: Tuple[int, int]
     blk_size: Tuple[int, int]
     graph_list: List[Tuple[int, WireGraph]]
 
     def place_wires(self, tr_manager: TrackManager, w: int, h: int) -> Dict[int, WireLookup]:
-        grid = tr_manager.grid
+        is_horizontal = tr_manager.grid.is_horizontal
 
         ans = {}
         for cur_layer, graph in self.graph_list:
-            dim = h if grid.is_horizontal(cur_layer) else w
+            dim = h if is_horizontal(cur_layer) else w
             graph.align_wires(cur_layer, tr_manager, 0, dim)
             ans[cur_layer] = graph.get_wire_lookup()
 
@@ -776,6 +871,7 @@ class WireSpecs:
         blk_w_res, blk_h_res = blk_pitch
 
         grid = tr_manager.grid
+        is_horizontal = grid.is_horizontal
 
         half_blk_x = half_blk_y = True
         graph_list = []
@@ -785,12 +881,14 @@ class WireSpecs:
             cur_graph = WireGraph.make_wire_graph(cur_layer, tr_manager, wd)
             cur_graph.place_compact(cur_layer, tr_manager)
             graph_list.append((cur_layer, cur_graph))
-            if grid.is_horizontal(cur_layer):
-                half_blk_y = half_blk_y and not cur_graph.has_center
-                h_min = max(h_min, cur_graph.upper)
+            upper = cur_graph.upper
+            no_center = not cur_graph.has_center
+            if is_horizontal(cur_layer):
+                half_blk_y = half_blk_y and no_center
+                h_min = max(h_min, upper)
             else:
-                half_blk_x = half_blk_x and not cur_graph.has_center
-                w_min = max(w_min, cur_graph.upper)
+                half_blk_x = half_blk_x and no_center
+                w_min = max(w_min, upper)
 
         blk_w, blk_h = grid.get_block_size(top_layer, half_blk_x=half_blk_x, half_blk_y=half_blk_y)
         blk_w = lcm([blk_w, blk_w_res])
@@ -801,33 +899,27 @@ class WireSpecs:
         return WireSpecs((w_min, h_min), (blk_w, blk_h), graph_list)
 
 
+@lru_cache(maxsize=1024)
 def _parse_cdba_name(name: str) -> Tuple[str, Sequence[int]]:
     if not name:
         raise ValueError(f'Cannot have empty string as wire name.')
 
     if name[-1] == '>':
-        idx = name.find('<')
-        if idx < 0:
-            raise ValueError(f'Illegal name: {name}')
-        basename = name[:idx]
-        if ':' in basename:
+        match = _BUS_NAME_RE.fullmatch(name)
+        if match is None:
             raise ValueError(f'Illegal name: {name}')
 
-        range_list = name[idx + 1:-1].split(':')
-        num = len(range_list)
-        try:
-            start = int(range_list[0])
-            if num == 1:
-                stop = start
-                step = 1
+        basename, start_str, stop_str, step_str = match.groups()
+        start = int(start_str)
+        if stop_str is None:
+            stop = start
+            step = 1
+        else:
+            stop = int(stop_str)
+            if step_str is None:
+                step = 2 * (stop > start) - 1
             else:
-                stop = int(range_list[1])
-                if num == 2:
-                    step = 2 * (stop > start) - 1
-                else:
-                    step = int(range_list[2])
-        except ValueError:
-            raise ValueError(f'Illegal name: {name}')
+                step = int(step_str)
 
         num = (stop - start) // step + 1
         return basename, range(start, start + num * step, step)
@@ -840,16 +932,10 @@ def _parse_cdba_name(name: str) -> Tuple[str, Sequence[int]]:
 def _is_wire_info(obj: Any) -> bool:
     if isinstance(obj, str):
         return True
-    if not hasattr(obj, '__len__') or not hasattr(obj, '__iter__'):
-        return False
-    num = len(obj)
-    if num == 2 or num == 3:
-        for v in obj:
-            if not isinstance(v, str):
-                return False
-        return True
-    else:
+    # check for plain tuples/lists first, as isinstance() on abstract classes is slower
+    if not isinstance(obj, (tuple, list)) and not isinstance(obj, Sequence):
         return False
+    return 2 <= len(obj) <= 3 and all(isinstance(v, str) for v in obj)
 
 
 def _wire_list_iter(wgraph: Any, align_default: Alignment) -> Iterable[List[Any], Alignment]:
@@ -877,7 +963,7 @@ def _wire_list_iter(wgraph: Any, align_default: Alignment) -> Iterable[List[Any]
         alignment of this list of wires.
     """
     if wgraph:
-        if isinstance(wgraph, Mapping):
+        if _is_wire_group_dict(wgraph):
             # wgraph is a WireGroup with contains alignment information
             yield wgraph['wires'], wgraph.get('align', align_default)
         elif _is_wire_info(wgraph[0]):
@@ -886,17 +972,59 @@ def _wire_list_iter(wgraph: Any, align_default: Alignment) -> Iterable[List[Any]
         else:
             # actual_data is a list of WireGroups
             for wire_grp in wgraph:
-                if isinstance(wire_grp, Mapping):
+                if _is_wire_group_dict(wire_grp):
                     yield wire_grp['wires'], wire_grp.get('align', align_default)
                 else:
                     yield wire_grp, align_default
 
 
-def _get_shared_set(shared: Sequence[str]) -> Set[Tuple[str, int]]:
+def _is_wire_group_dict(obj: Any) -> bool:
+    # check for plain dictionaries first, as isinstance() on abstract classes is slower.
+    # Mapping check is still needed for Param and other immutable dictionaries.
+    return type(obj) is dict or isinstance(obj, Mapping)
+
+
+@lru_cache(maxsize=256)
+def _get_shared_set(shared: Tuple[str, ...]) -> FrozenSet[Tuple[str, int]]:
     shared_set = set()
     for name in shared:
         basename, idx_list = _parse_cdba_name(name)
-        for idx in idx_list:
-            shared_set.add((name, idx))
+        shared_set.update((basename, idx) for idx in idx_list)
+
+    return frozenset(shared_set)
+
+
+def _make_wire_data(wire_data: Any, alignment: Alignment, ptype_default: str) -> WireData:
+    if isinstance(wire_data, Mapping):
+        actual_data = wire_data['data']
+        alignment = Alignment[wire_data.get('align', alignment.name)]
+        shared_wires = wire_data.get('shared', [])
+    else:
+        actual_data = wire_data
+        shared_wires = []
+
+    wire_grps = []
+    for wire_grp, align in _wire_list_iter(actual_data, alignment):
+        wire_list = []
+        for winfo in wire_grp:
+            if isinstance(winfo, str):
+                name = winfo
+                wtype = ''
+                ptype = ptype_default
+            else:
+                name: str = winfo[0]
+                ptype: str = winfo[1]
+                wtype: str = '' if len(winfo) < 3 else winfo[2]
+                if not ptype:
+                    ptype = ptype_default
+            wire_list.append((name, ptype, wtype))
+        wire_grps.append((ImmutableList(wire_list), align))
+
+    return WireData(ImmutableList(wire_grps), ImmutableList(shared_wires))
+
+
+@lru_cache(maxsize=4096)
+def _make_wire_data_cached(wire_data: Any, alignment: Alignment, ptype_default: str) -> WireData:
+    # WireData is immutable, so the same object can be shared by all callers
+    return _make_wire_data(wire_data, alignment, ptype_default)
 
-    return shared_set
@@ -15,7 +15,6 @@
 
 from typing import Dict, Any
 
-import pkg_resources
 from pathlib import Path
 
 from bag.design.module import Module
@@ -30,9 +29,7 @@ class xbase__metal_short(Module):
     Fill in high level description here.
     """
 
-    yaml_file = pkg_resources.resource_filename(__name__,
-                                                str(Path('netlist_info',
-                                                         'metal_short.yaml')))
+    yaml_file = str(Path(__file__).parent / 'netlist_info' / 'metal_short.yaml')
 
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
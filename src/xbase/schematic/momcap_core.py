@@ -15,8 +15,7 @@
 
 from typing import Dict, Any
 
-import os
-import pkg_resources
+from pathlib import Path
 
 from bag.design.module import Module
 from bag.design.database import ModuleDB
@@ -30,9 +29,7 @@ class xbase__momcap_core(Module):
     Fill in high level description here.
     """
 
-    yaml_file = pkg_resources.resource_filename(__name__,
-                                                os.path.join('netlist_info',
-                                                             'momcap_core.yaml'))
+    yaml_file = str(Path(__file__).parent / 'netlist_info' / 'momcap_core.yaml')
 
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
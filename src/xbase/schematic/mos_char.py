@@ -15,8 +15,7 @@
 
 from typing import Dict, Any, List, Tuple, Optional
 
-import os
-import pkg_resources
+from pathlib import Path
 
 from bag.design.module import Module
 from bag.design.database import ModuleDB
@@ -30,9 +29,7 @@ class xbase__mos_char(Module):
     Fill in high level description here.
     """
 
-    yaml_file = pkg_resources.resource_filename(__name__,
-                                                os.path.join('netlist_info',
-                                                             'mos_char.yaml'))
+    yaml_file = str(Path(__file__).parent / 'netlist_info' / 'mos_char.yaml')
 
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
@@ -57,11 +54,12 @@ class xbase__mos_char(Module):
         )
 
     def get_master_basename(self) -> str:
-        w = self.params['w']
-        lch = self.params['lch']
-        seg = self.params['seg']
-        intent = self.params['intent']
-        stack = self.params['stack']
+        params = self.params
+        w = params['w']
+        lch = params['lch']
+        seg = params['seg']
+        intent = params['intent']
+        stack = params['stack']
         ans = f'mos_char_{intent}_w{w}_l{lch}_seg{seg}'
         if stack != 1:
             ans += f'_stack{stack}'
@@ -15,8 +15,7 @@
 
 from typing import Dict, Any
 
-import os
-import pkg_resources
+from pathlib import Path
 
 from bag.design.module import Module
 from bag.design.database import ModuleDB
@@ -30,9 +29,7 @@ class xbase__pmos4_analog(Module):
     Fill in high level description here.
     """
 
-    yaml_file = pkg_resources.resource_filename(__name__,
-                                                os.path.join('netlist_info',
-                                                             'pmos4_analog.yaml'))
+    yaml_file = str(Path(__file__).parent / 'netlist_info' / 'pmos4_analog.yaml')
 
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
@@ -54,11 +51,12 @@ class xbase__pmos4_analog(Module):
         )
 
     def get_master_basename(self) -> str:
-        w = self.params['w']
-        l = self.params['lch']
-        seg = self.params['seg']
-        intent = self.params['intent']
-        stack = self.params['stack']
+        params = self.params
+        w = params['w']
+        l = params['lch']
+        seg = params['seg']
+        intent = params['intent']
+        stack = params['stack']
         ans = f'pmos4_{intent}_w{w}_l{l}_seg{seg}'
         if stack != 1:
             ans += f'_stack{stack}'
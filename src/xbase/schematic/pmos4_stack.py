@@ -15,7 +15,6 @@
 
 from typing import Dict, Any
 
-import pkg_resources
 from pathlib import Path
 
 from pybag.enum import TermType
@@ -32,9 +31,7 @@ class xbase__pmos4_stack(Module):
     Fill in high level description here.
     """
 
-    yaml_file = pkg_resources.resource_filename(__name__,
-                                                str(Path('netlist_info',
-                                                         'pmos4_stack.yaml')))
+    yaml_file = str(Path(__file__).parent / 'netlist_info' / 'pmos4_stack.yaml')
 
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
@@ -58,11 +55,12 @@ class xbase__pmos4_stack(Module):
         )
 
     def get_master_basename(self) -> str:
-        w = self.params['w']
-        l = self.params['lch']
-        seg = self.params['seg']
-        intent = self.params['intent']
-        stack = self.params['stack']
+        params = self.params
+        w = params['w']
+        l = params['lch']
+        seg = params['seg']
+        intent = params['intent']
+        stack = params['stack']
         if stack > 1:
             ans = f'pmos4_{intent}_stack{stack}_w{w}_l{l}_seg{seg}'
         else:
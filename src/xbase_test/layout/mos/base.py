@@ -13,10 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Sequence
+
+from functools import lru_cache
 
 from bag.util.immutable import Param
 from bag.layout.template import TemplateDB
+from bag.layout.routing.grid import RoutingGrid
 
 from xbase.layout.enum import MOSType, Alignment
 from xbase.layout.wires import WireData
@@ -24,6 +27,11 @@ from xbase.layout.mos.placement.data import MOSArrayPlaceInfo, make_pinfo_compac
 from xbase.layout.mos.data import MOSRowSpecs
 from xbase.layout.mos.base import MOSBasePlaceInfo, MOSBase
 
+# map from MOSType name to MOSType, skips the EnumMeta.__getitem__ indirection
+_MOS_TYPE_TABLE = MOSType.__members__
+# WireData is immutable, so all rows share the same empty wire specification
+_EMPTY_WIRES = WireData.make_wire_data([], Alignment.CENTER_COMPACT, '')
+
 
 class MOSOnly(MOSBase):
     """A MOSBase of only rows of transistors, no connection specs.
@@ -47,35 +55,19 @@ class MOSOnly(MOSBase):
         return dict(min_ntr=0, w_list=None)
 
     def draw_layout(self):
-        lch: int = self.params['lch']
-        fg: int = self.params['fg']
-        row_list: List[Tuple[str, int, str]] = self.params['row_list']
-        min_ntr: int = self.params['min_ntr']
-        w_list: Optional[List[int]] = self.params['w_list']
-
-        if not row_list:
-            raise ValueError('Cannot draw empty rows.')
+        params = self.params
+        lch: int = params['lch']
+        fg: int = params['fg']
+        row_list: List[Tuple[str, int, str]] = params['row_list']
+        min_ntr: int = params['min_ntr']
+        w_list: Optional[List[int]] = params['w_list']
+
+        pinfo = _get_rows_pinfo(self.grid, lch, row_list, min_ntr)
         if w_list is None:
             w_list = [info[1] for info in row_list]
         elif len(w_list) != len(row_list):
             raise ValueError('width list length mismatch')
 
-        row_specs = []
-        hm_layer = MOSBasePlaceInfo.get_conn_layer(self.grid.tech_info, lch) + 1
-        empty_wires = WireData.make_wire_data([], Alignment.CENTER_COMPACT, '')
-        for info in row_list:
-            mtype, w, th = info[:3]
-            if len(info) > 3:
-                flip = info[3]
-            else:
-                flip = False
-            row_specs.append(MOSRowSpecs(MOSType[mtype], w, th, empty_wires, empty_wires,
-                                         flip=flip))
-
-        ainfo = MOSArrayPlaceInfo(self.grid, lch, {}, {})
-        min_height = self.grid.get_track_pitch(hm_layer) * min_ntr
-        pinfo = make_pinfo_compact(ainfo, row_specs, True, True, min_height=min_height)
-
         self.draw_base(pinfo)
         self.set_mos_size(fg)
 
@@ -106,25 +98,15 @@ class MOSOnlySPM(MOSBase):
         return dict(mos_sub=False, min_ntr=0)
 
     def draw_layout(self):
-        lch: int = self.params['lch']
-        fg: int = self.params['fg']
-        fg_sp: int = self.params['fg_sp']
-        row_list: List[Tuple[str, int, str]] = self.params['row_list']
-        min_ntr: int = self.params['min_ntr']
-        mos_sub: bool = self.params['mos_sub']
-
-        if not row_list:
-            raise ValueError('Cannot draw empty rows.')
-
-        row_specs = []
-        empty_wires = WireData.make_wire_data([], Alignment.CENTER_COMPACT, '')
-        hm_layer = MOSBasePlaceInfo.get_conn_layer(self.grid.tech_info, lch) + 1
-        for mtype, w, th in row_list:
-            row_specs.append(MOSRowSpecs(MOSType[mtype], w, th, empty_wires, empty_wires))
-
-        ainfo = MOSArrayPlaceInfo(self.grid, lch, {}, {})
-        min_height = self.grid.get_track_pitch(hm_layer) * min_ntr
-        pinfo = make_pinfo_compact(ainfo, row_specs, True, True, min_height=min_height)
+        params = self.params
+        lch: int = params['lch']
+        fg: int = params['fg']
+        fg_sp: int = params['fg_sp']
+        row_list: List[Tuple[str, int, str]] = params['row_list']
+        min_ntr: int = params['min_ntr']
+        mos_sub: bool = params['mos_sub']
+
+        pinfo = _get_rows_pinfo(self.grid, lch, row_list, min_ntr)
 
         self.draw_base(pinfo)
         self.set_mos_size(2 * fg + fg_sp)
@@ -154,21 +136,13 @@ class MOSOnlySPE(MOSBase):
         )
 
     def draw_layout(self):
-        lch: int = self.params['lch']
-        fg: int = self.params['fg']
-        fg_sp: int = self.params['fg_sp']
-        row_list: List[Tuple[str, int, str]] = self.params['row_list']
-
-        if not row_list:
-            raise ValueError('Cannot draw empty rows.')
+        params = self.params
+        lch: int = params['lch']
+        fg: int = params['fg']
+        fg_sp: int = params['fg_sp']
+        row_list: List[Tuple[str, int, str]] = params['row_list']
 
-        row_specs = []
-        empty_wires = WireData.make_wire_data([], Alignment.CENTER_COMPACT, '')
-        for mtype, w, th in row_list:
-            row_specs.append(MOSRowSpecs(MOSType[mtype], w, th, empty_wires, empty_wires))
-
-        ainfo = MOSArrayPlaceInfo(self.grid, lch, {}, {})
-        pinfo = make_pinfo_compact(ainfo, row_specs, True, True)
+        pinfo = _get_rows_pinfo(self.grid, lch, row_list)
 
         self.draw_base(pinfo)
         self.set_mos_size(2 * fg_sp + fg)
@@ -193,23 +167,66 @@ class SubOnly(MOSBase):
         )
 
     def draw_layout(self):
-        lch: int = self.params['lch']
-        fg: int = self.params['fg']
-        row_list: List[Tuple[str, int, str]] = self.params['row_list']
-
-        if not row_list:
-            raise ValueError('Cannot draw empty rows.')
-
-        row_specs = []
-        empty_wires = WireData.make_wire_data([], Alignment.CENTER_COMPACT, '')
-        for mtype, w, th in row_list:
-            row_specs.append(MOSRowSpecs(MOSType[mtype], w, th, empty_wires, empty_wires))
+        params = self.params
+        lch: int = params['lch']
+        fg: int = params['fg']
+        row_list: List[Tuple[str, int, str]] = params['row_list']
 
-        ainfo = MOSArrayPlaceInfo(self.grid, lch, {}, {})
-        pinfo = make_pinfo_compact(ainfo, row_specs, True, True)
+        pinfo = _get_rows_pinfo(self.grid, lch, row_list)
 
         self.draw_base(pinfo)
         self.set_mos_size(fg)
 
         for ridx in range(len(row_list)):
             self.add_substrate_contact(ridx, 0, seg=fg)
+
+
+def _get_rows_pinfo(grid: RoutingGrid, lch: int, row_list: Sequence[Sequence[Any]],
+                    min_ntr: int = 0) -> MOSBasePlaceInfo:
+    """Returns the placement information of the given transistor/substrate rows.
+
+    Parameters
+    ----------
+    grid : RoutingGrid
+        the template RoutingGrid.
+    lch : int
+        the channel length.
+    row_list : Sequence[Sequence[Any]]
+        list of mos_type/width/threshold tuples, with an optional flip flag.
+    min_ntr : int
+        minimum number of horizontal tracks per row.
+
+    Returns
+    -------
+    pinfo : MOSBasePlaceInfo
+        the placement information object.
+    """
+    if not row_list:
+        raise ValueError('Cannot draw empty rows.')
+
+    row_specs = []
+    for info in row_list:
+        mtype, w, th = info[:3]
+        flip = info[3] if len(info) > 3 else False
+        row_specs.append(MOSRowSpecs(_MOS_TYPE_TABLE[mtype], w, th, _EMPTY_WIRES, _EMPTY_WIRES,
+                                     flip=flip))
+
+    if min_ntr:
+        hm_layer = MOSBasePlaceInfo.get_conn_layer(grid.tech_info, lch) + 1
+        min_height = grid.get_track_pitch(hm_layer) * min_ntr
+    else:
+        min_height = 0
+    return _get_pinfo_compact(_get_arr_info(grid, lch), tuple(row_specs), min_height)
+
+
+@lru_cache(maxsize=32)
+def _get_arr_info(grid: RoutingGrid, lch: int) -> MOSArrayPlaceInfo:
+    # MOSArrayPlaceInfo is immutable, so it can be shared by all templates on the same grid
+    return MOSArrayPlaceInfo(grid, lch, {}, {})
+
+
+@lru_cache(maxsize=128)
+def _get_pinfo_compact(ainfo: MOSArrayPlaceInfo, row_specs: Tuple[MOSRowSpecs, ...],
+                       min_height: int) -> MOSBasePlaceInfo:
+    # row specifications are immutable, so the same rows always give the same placement
+    return make_pinfo_compact(ainfo, row_specs, True, True, min_height=min_height)
@@ -41,11 +41,12 @@ class TilePatternTest(MOSBase):
         return dict(min_ntr=0, w_list=None)
 
     def draw_layout(self):
-        pinfo = MOSBasePlaceInfo.make_place_info(self.grid, self.params['pinfo'])
+        params = self.params
+        pinfo = MOSBasePlaceInfo.make_place_info(self.grid, params['pinfo'])
         self.draw_base(pinfo)
 
-        ncol: int = self.params['ncol']
-        ntile: int = self.params['ntile']
+        ncol: int = params['ncol']
+        ntile: int = params['ntile']
 
         self.set_mos_size(ncol, ntile)
 